@@ -199,10 +199,10 @@ def demo_leaderboard() -> None:
         "model-gamma": [{"score": 0.99}, {"score": 0.97}, {"score": 0.98}, {"score": 0.96}],
     }
 
-    scores: dict[str, float] = {}
-    for model_name, outputs in model_runs.items():
-        result = runner.evaluate("helpfulness-v1", outputs, model_name=model_name)
-        scores[model_name] = result.score
+    scores: dict[str, float] = {
+        result.model_name: result.score
+        for result in runner.evaluate_batch("helpfulness-v1", model_runs)
+    }
 
     print("Leaderboard — Helpfulness Benchmark v1:")
     print()
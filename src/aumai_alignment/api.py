@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 
 from aumai_alignment.core import DatasetNotFoundError, DatasetRegistry, EvaluationRunner
 from aumai_alignment.models import AlignmentDataset, EvaluationResult, MarketplaceListing
@@ -18,9 +18,12 @@ def list_datasets(
     query: str = "",
     category: str | None = None,
     min_quality: float = 0.0,
+    limit: int = Query(default=50, ge=1),
 ) -> list[MarketplaceListing]:
     """List and search alignment datasets."""
-    return _registry.search(query=query, category=category, min_quality=min_quality)
+    return _registry.search(
+        query=query, category=category, min_quality=min_quality, limit=limit
+    )
 
 
 @app.get("/api/datasets/{dataset_id}", response_model=AlignmentDataset)
@@ -47,3 +50,21 @@ def get_evaluations(dataset_id: str) -> list[EvaluationResult]:
     except DatasetNotFoundError as exc:
         raise HTTPException(status_code=404, detail=f"Dataset '{dataset_id}' not found") from exc
     return _runner.get_results(dataset_id)
+
+
+@app.post(
+    "/api/evaluations/{dataset_id}/batch",
+    response_model=list[EvaluationResult],
+    status_code=201,
+)
+def evaluate_batch(
+    dataset_id: str,
+    runs: dict[str, list[dict[str, str | float | bool]]],
+) -> list[EvaluationResult]:
+    """Evaluate several models' outputs against a dataset in one request."""
+    try:
+        return _runner.evaluate_batch(dataset_id, runs)
+    except DatasetNotFoundError as exc:
+        raise HTTPException(
+            status_code=404, detail=f"Dataset '{dataset_id}' not found"
+        ) from exc
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from aumai_alignment.core import DatasetNotFoundError, DatasetRegistry, EvaluationRunner
-from aumai_alignment.models import AlignmentDataset
+if TYPE_CHECKING:
+    from aumai_alignment.core import DatasetRegistry
+    from aumai_alignment.models import AlignmentDataset
 
-_registry = DatasetRegistry()
-_runner = EvaluationRunner(registry=_registry)
+# Pydantic and the core modules are imported inside the commands that need
+# them so that `--help`, `--version` and argument errors stay fast.
+
+
+@functools.cache
+def _get_registry() -> DatasetRegistry:
+    """Return the process-wide registry, creating it on first use."""
+    from aumai_alignment.core import DatasetRegistry
+
+    return DatasetRegistry()
 
 
 @click.group()
@@ -27,7 +37,9 @@ def main() -> None:
 @click.option("--min-quality", default=0.0, show_default=True, type=float, help="Minimum quality score.")
 def search(query: str, category: str | None, min_quality: float) -> None:
     """Search for alignment datasets in the registry."""
-    results = _registry.search(query=query, category=category, min_quality=min_quality)
+    results = _get_registry().search(
+        query=query, category=category, min_quality=min_quality
+    )
     if not results:
         click.echo("No datasets found matching your criteria.")
         return
@@ -39,26 +51,45 @@ def search(query: str, category: str | None, min_quality: float) -> None:
         )
 
 
+def _parse_config(path: Path, raw: bytes) -> AlignmentDataset:
+    """Validate a dataset config read from a YAML or JSON file."""
+    from aumai_alignment.models import AlignmentDataset
+
+    if path.suffix in {".yaml", ".yml"}:
+        import yaml  # type: ignore[import-untyped]
+
+        try:
+            from yaml import CSafeLoader as _Loader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as _Loader
+
+        return AlignmentDataset.model_validate(yaml.load(raw, Loader=_Loader))
+    return AlignmentDataset.model_validate_json(raw)
+
+
 @main.command("register")
 @click.option(
     "--config",
     required=True,
+    multiple=True,
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    help="Path to dataset YAML/JSON config file.",
+    help="Path to dataset YAML/JSON config file (repeatable).",
 )
-def register(config: Path) -> None:
-    """Register a dataset from a YAML or JSON config file."""
-    import yaml  # type: ignore[import-untyped]
-
-    raw = config.read_text(encoding="utf-8")
-    if config.suffix in {".yaml", ".yml"}:
-        data: dict[str, object] = yaml.safe_load(raw)
-    else:
-        data = json.loads(raw)
-
-    dataset = AlignmentDataset.model_validate(data)
-    _registry.register(dataset)
-    click.echo(f"Registered dataset '{dataset.name}' with ID '{dataset.dataset_id}'.")
+def register(config: tuple[Path, ...]) -> None:
+    """Register datasets from YAML or JSON config files."""
+    from aumai_alignment.io import read_many
+
+    registry = _get_registry()
+    paths = list(config)
+    contents = read_many(paths)
+    datasets = [
+        _parse_config(path, raw) for path, raw in zip(paths, contents, strict=True)
+    ]
+    for dataset in datasets:
+        registry.register(dataset)
+        click.echo(
+            f"Registered dataset '{dataset.name}' with ID '{dataset.dataset_id}'."
+        )
 
 
 @main.command("serve")
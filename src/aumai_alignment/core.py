@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
+import operator
 import re
-from datetime import datetime, timezone
-from typing import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Callable, cast
+from urllib.parse import quote
 
 from aumai_alignment.models import (
     AlignmentDataset,
@@ -15,6 +19,19 @@ from aumai_alignment.models import (
 __all__ = ["DatasetRegistry", "EvaluationRunner"]
 
 
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+_SEARCH_CACHE_SIZE = 128
+
+_SearchKey = tuple[str, str | None, float, int | None]
+
+
+def _rank_key(dataset: AlignmentDataset) -> tuple[float, str]:
+    """Sort key ordering datasets by descending quality, then dataset ID."""
+    return (-dataset.quality_score, dataset.dataset_id)
+
+
 class DatasetNotFoundError(KeyError):
     """Raised when a dataset is not found in the registry."""
 
@@ -25,6 +42,23 @@ class DatasetRegistry:
     def __init__(self) -> None:
         self._datasets: dict[str, AlignmentDataset] = {}
         self._listings: dict[str, MarketplaceListing] = {}
+        self._haystacks: dict[str, str] = {}
+        self._token_index: dict[str, set[str]] = {}
+        # Rank keys are (-quality_score, dataset_id), kept sorted both overall
+        # and per lowercased category so searches can walk them best-first.
+        # The key and category each ID was indexed under are stored because a
+        # registered dataset may be mutated in place before it is re-registered.
+        self._rank_keys: dict[str, tuple[float, str]] = {}
+        self._categories: dict[str, str] = {}
+        self._ranked: list[tuple[float, str]] = []
+        self._by_category: dict[str, list[tuple[float, str]]] = {}
+        # Cached results are tagged with the generation they were computed in;
+        # register() bumps it once the indexes are updated, so a result raced
+        # by a concurrent register is never served.
+        self._generation = 0
+        self._search_cache: dict[
+            _SearchKey, tuple[int, list[MarketplaceListing]]
+        ] = {}
 
     def register(self, dataset: AlignmentDataset) -> None:
         """Register a dataset and create a marketplace listing for it.
@@ -32,23 +66,64 @@ class DatasetRegistry:
         Args:
             dataset: The alignment dataset to register.
         """
+        if dataset.dataset_id in self._datasets:
+            self._unindex(dataset.dataset_id)
         self._datasets[dataset.dataset_id] = dataset
-        if dataset.dataset_id not in self._listings:
+        existing = self._listings.get(dataset.dataset_id)
+        if existing is None:
             self._listings[dataset.dataset_id] = MarketplaceListing(dataset=dataset)
         else:
-            existing = self._listings[dataset.dataset_id]
-            self._listings[dataset.dataset_id] = MarketplaceListing(
-                dataset=dataset,
-                downloads=existing.downloads,
-                rating=existing.rating,
-                reviews=existing.reviews,
-            )
+            existing.dataset = dataset
+        haystack = "\x1f".join(
+            [dataset.name, dataset.description, *dataset.tags]
+        ).lower()
+        self._haystacks[dataset.dataset_id] = haystack
+        for token in set(_TOKEN_PATTERN.findall(haystack)):
+            self._token_index.setdefault(token, set()).add(dataset.dataset_id)
+        rank_key = self._rank_keys[dataset.dataset_id] = _rank_key(dataset)
+        bisect.insort(self._ranked, rank_key)
+        category = self._categories[dataset.dataset_id] = dataset.category.lower()
+        category_ranked = self._by_category.setdefault(category, [])
+        bisect.insort(category_ranked, rank_key)
+        self._generation += 1
+        self._search_cache.clear()
+
+    def _unindex(self, dataset_id: str) -> None:
+        """Remove a previously registered dataset from the search indexes."""
+        haystack = self._haystacks.pop(dataset_id)
+        for token in set(_TOKEN_PATTERN.findall(haystack)):
+            bucket = self._token_index[token]
+            bucket.discard(dataset_id)
+            if not bucket:
+                del self._token_index[token]
+        rank_key = self._rank_keys.pop(dataset_id)
+        del self._ranked[bisect.bisect_left(self._ranked, rank_key)]
+        category = self._categories.pop(dataset_id)
+        category_ranked = self._by_category[category]
+        del category_ranked[bisect.bisect_left(category_ranked, rank_key)]
+        if not category_ranked:
+            del self._by_category[category]
+
+    def _match_token(self, token: str, exact: bool) -> set[str]:
+        """Return the IDs of datasets whose indexed text contains *token*.
+
+        Exact tokens are a single index lookup; partial tokens (which may be a
+        fragment of a longer word) are matched against the token vocabulary.
+        """
+        if exact:
+            return self._token_index.get(token, set())
+        matches: set[str] = set()
+        for indexed_token, dataset_ids in self._token_index.items():
+            if token in indexed_token:
+                matches |= dataset_ids
+        return matches
 
     def search(
         self,
         query: str,
         category: str | None = None,
         min_quality: float = 0.0,
+        limit: int | None = None,
     ) -> list[MarketplaceListing]:
         """Search and filter marketplace listings.
 
@@ -56,28 +131,70 @@ class DatasetRegistry:
             query: Text query matched against name, description, and tags.
             category: Optional category filter.
             min_quality: Minimum quality score threshold (0.0–1.0).
+            limit: Maximum number of listings to return; ``None`` returns all.
 
         Returns:
             Sorted list of matching marketplace listings (descending quality).
         """
-        query_lower = query.lower().strip()
+        # Results only change when a dataset is (re-)registered, which bumps
+        # the generation; download counts live on the shared listing objects.
+        key: _SearchKey = (
+            query.lower().strip(),
+            category.lower() if category is not None else None,
+            min_quality,
+            limit,
+        )
+        generation = self._generation
+        cached = self._search_cache.get(key)
+        if cached is not None and cached[0] == generation:
+            return list(cached[1])
+        results = self._search(*key)
+        if len(self._search_cache) >= _SEARCH_CACHE_SIZE:
+            self._search_cache.clear()
+        self._search_cache[key] = (generation, results)
+        return list(results)
+
+    def _search(
+        self,
+        query_lower: str,
+        category_lower: str | None,
+        min_quality: float,
+        limit: int | None,
+    ) -> list[MarketplaceListing]:
+        """Run an uncached search with a normalized query and category."""
+        if category_lower is None:
+            ranked = self._ranked
+        else:
+            ranked = self._by_category.get(category_lower, [])
+        if not ranked:
+            return []
+
+        # A token bounded by separators on both sides of the query must appear
+        # as a whole token in the haystack; edge tokens may be word fragments.
+        candidates: set[str] | None = None
+        for match in _TOKEN_PATTERN.finditer(query_lower):
+            exact = match.start() > 0 and match.end() < len(query_lower)
+            matches = self._match_token(match.group(), exact)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+
+        if limit is not None and limit <= 0:
+            return []
+
+        # Walk listings best-first so the quality cut-off and the limit can
+        # both stop the scan early; the output needs no further sorting.
         results: list[MarketplaceListing] = []
-
-        for listing in self._listings.values():
-            dataset = listing.dataset
-            if dataset.quality_score < min_quality:
+        for negative_quality, dataset_id in ranked:
+            if -negative_quality < min_quality:
+                break
+            if candidates is not None and dataset_id not in candidates:
                 continue
-            if category is not None and dataset.category.lower() != category.lower():
+            if query_lower and query_lower not in self._haystacks[dataset_id]:
                 continue
-            if query_lower:
-                searchable = " ".join(
-                    [dataset.name, dataset.description] + dataset.tags
-                ).lower()
-                if not re.search(re.escape(query_lower), searchable):
-                    continue
-            results.append(listing)
-
-        results.sort(key=lambda listing: listing.dataset.quality_score, reverse=True)
+            results.append(self._listings[dataset_id])
+            if len(results) == limit:
+                break
         return results
 
     def get(self, dataset_id: str) -> AlignmentDataset:
@@ -103,14 +220,9 @@ class DatasetRegistry:
         Args:
             dataset_id: The unique dataset identifier.
         """
-        if dataset_id in self._listings:
-            listing = self._listings[dataset_id]
-            self._listings[dataset_id] = MarketplaceListing(
-                dataset=listing.dataset,
-                downloads=listing.downloads + 1,
-                rating=listing.rating,
-                reviews=listing.reviews,
-            )
+        listing = self._listings.get(dataset_id)
+        if listing is not None:
+            listing.downloads += 1
 
 
 ScoringFunction = Callable[[dict[str, str | float | bool]], float]
@@ -124,6 +236,34 @@ def _default_scorer(output: dict[str, str | float | bool]) -> float:
     return 0.5
 
 
+_get_score = operator.itemgetter("score")
+
+
+def _default_scores(outputs: list[dict[str, str | float | bool]]) -> list[float]:
+    """Apply :func:`_default_scorer` to a whole batch of outputs.
+
+    Scores are pulled out with ``operator.itemgetter``, falling back to
+    ``dict.get`` when any output lacks a ``score`` key. If every score is a
+    plain float they are clamped with a direct range check; otherwise each
+    one goes through the general numeric check used by ``_default_scorer``.
+    """
+    try:
+        raw_scores: list[str | float | bool] = list(map(_get_score, outputs))
+    except KeyError:
+        raw_scores = [output.get("score", 0.5) for output in outputs]
+    if all(type(raw) is float for raw in raw_scores):
+        # Plain floats skip the isinstance/float() dispatch; NaN fails the range
+        # test and clamps to 1.0, exactly as _default_scorer does.
+        return [
+            raw if 0.0 <= raw <= 1.0 else (0.0 if raw < 0.0 else 1.0)
+            for raw in cast("list[float]", raw_scores)
+        ]
+    return [
+        max(0.0, min(1.0, float(raw))) if isinstance(raw, (int, float)) else 0.5
+        for raw in raw_scores
+    ]
+
+
 class EvaluationRunner:
     """Runs alignment evaluations against registered datasets."""
 
@@ -131,10 +271,24 @@ class EvaluationRunner:
         self,
         registry: DatasetRegistry,
         scoring_fn: ScoringFunction | None = None,
+        results_dir: Path | None = None,
     ) -> None:
+        """Create a runner.
+
+        Args:
+            registry: Registry used to validate dataset IDs.
+            scoring_fn: Per-output scoring function; defaults to reading ``score``.
+                Set ``is_constant = True`` on a function that ignores its
+                input so it is called once per evaluation, not once per output.
+            results_dir: Optional directory for persisting results. Each dataset
+                gets an append-only ``<dataset_id>.jsonl`` file there.
+        """
         self._registry = registry
         self._scoring_fn: ScoringFunction = scoring_fn or _default_scorer
         self._results: dict[str, list[EvaluationResult]] = {}
+        self._results_dir = results_dir
+        if results_dir is not None:
+            results_dir.mkdir(parents=True, exist_ok=True)
 
     def evaluate(
         self,
@@ -157,31 +311,87 @@ class EvaluationRunner:
         """
         self._registry.get(dataset_id)  # validates existence
 
-        if not model_outputs:
-            scores: list[float] = []
-        else:
-            scores = [self._scoring_fn(output) for output in model_outputs]
+        result = self._build_result(
+            dataset_id,
+            model_name,
+            self._score(model_outputs),
+            datetime.now(tz=UTC),
+        )
+        self._record(dataset_id, [result])
+        return result
 
-        aggregate_score = sum(scores) / len(scores) if scores else 0.0
+    def evaluate_batch(
+        self,
+        dataset_id: str,
+        runs: dict[str, list[dict[str, str | float | bool]]],
+    ) -> list[EvaluationResult]:
+        """Evaluate several models' outputs against the same dataset.
+
+        The dataset is looked up once and every result shares one timestamp.
+
+        Args:
+            dataset_id: The dataset to evaluate against.
+            runs: Mapping of model name to that model's list of output dicts.
+
+        Returns:
+            One EvaluationResult per model, in the order of ``runs``.
+
+        Raises:
+            DatasetNotFoundError: If dataset_id is not registered.
+        """
+        self._registry.get(dataset_id)  # validates existence
+
+        evaluated_at = datetime.now(tz=UTC)
+        results = [
+            self._build_result(
+                dataset_id, model_name, self._score(outputs), evaluated_at
+            )
+            for model_name, outputs in runs.items()
+        ]
+        self._record(dataset_id, results)
+        return results
+
+    def _score(self, model_outputs: list[dict[str, str | float | bool]]) -> list[float]:
+        """Score each model output with the configured scoring function.
+
+        A scoring function with a truthy ``is_constant`` attribute is called
+        once and its value reused for every output.
+        """
+        if self._scoring_fn is _default_scorer:
+            return _default_scores(model_outputs)
+        if model_outputs and getattr(self._scoring_fn, "is_constant", False):
+            return [self._scoring_fn(model_outputs[0])] * len(model_outputs)
+        return list(map(self._scoring_fn, model_outputs))
+
+    @staticmethod
+    def _build_result(
+        dataset_id: str,
+        model_name: str,
+        scores: list[float],
+        evaluated_at: datetime,
+    ) -> EvaluationResult:
+        """Aggregate per-output scores into an EvaluationResult."""
+        if scores:
+            aggregate_score = sum(scores) / len(scores)
+            min_score, max_score = min(scores), max(scores)
+        else:
+            aggregate_score = min_score = max_score = 0.0
 
         metrics: dict[str, float] = {
             "mean_score": aggregate_score,
-            "min_score": min(scores) if scores else 0.0,
-            "max_score": max(scores) if scores else 0.0,
+            "min_score": min_score,
+            "max_score": max_score,
             "sample_count": float(len(scores)),
         }
 
-        result = EvaluationResult(
+        return EvaluationResult(
             dataset_id=dataset_id,
             model_name=model_name,
             score=round(aggregate_score, 4),
             metrics=metrics,
-            evaluated_at=datetime.now(tz=timezone.utc),
+            evaluated_at=evaluated_at,
         )
 
-        self._results.setdefault(dataset_id, []).append(result)
-        return result
-
     def get_results(self, dataset_id: str) -> list[EvaluationResult]:
         """Retrieve all evaluation results for a dataset.
 
@@ -191,4 +401,38 @@ class EvaluationRunner:
         Returns:
             List of EvaluationResult objects (may be empty).
         """
+        if self._results_dir is not None and dataset_id not in self._results:
+            self._results[dataset_id] = self._load(self._history_path(dataset_id))
         return self._results.get(dataset_id, [])
+
+    def _record(self, dataset_id: str, results: list[EvaluationResult]) -> None:
+        """Store new results in memory and append them to the history file."""
+        if self._results_dir is None:
+            self._results.setdefault(dataset_id, []).extend(results)
+            return
+        with self._history_path(dataset_id).open("a", encoding="utf-8") as handle:
+            handle.writelines(result.model_dump_json() + "\n" for result in results)
+        # Persisted history is only read on demand; once it has been loaded,
+        # keep the cached copy in step with the file.
+        if dataset_id in self._results:
+            self._results[dataset_id].extend(results)
+
+    def _history_path(self, dataset_id: str) -> Path:
+        """Return the history file for a dataset inside ``results_dir``.
+
+        The ID is percent-encoded so separators such as ``/`` cannot reach
+        into subdirectories or outside ``results_dir``.
+        """
+        return cast(Path, self._results_dir) / f"{quote(dataset_id, safe='')}.jsonl"
+
+    @staticmethod
+    def _load(path: Path) -> list[EvaluationResult]:
+        """Read a persisted JSONL result history, oldest first."""
+        if not path.exists():
+            return []
+        with path.open(encoding="utf-8") as handle:
+            return [
+                EvaluationResult.model_validate_json(line)
+                for line in handle
+                if line.strip()
+            ]
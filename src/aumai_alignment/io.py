@@ -0,0 +1,29 @@
+"""File I/O helpers for aumai-alignment."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+__all__ = ["read_many"]
+
+
+def read_many(paths: list[Path]) -> list[bytes]:
+    """Read several files, overlapping the blocking reads.
+
+    A single file is read directly; larger batches are read on a thread pool
+    so the per-file open/read syscalls run concurrently.
+
+    Args:
+        paths: Files to read.
+
+    Returns:
+        The contents of each file, in the same order as ``paths``.
+
+    Raises:
+        OSError: If any of the files cannot be read.
+    """
+    if len(paths) <= 1:
+        return [path.read_bytes() for path in paths]
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(Path.read_bytes, paths))
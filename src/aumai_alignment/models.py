@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 __all__ = [
     "AlignmentDataset",
@@ -39,7 +39,13 @@ class EvaluationResult(BaseModel):
 
 
 class MarketplaceListing(BaseModel):
-    """Marketplace listing wrapping a dataset with marketplace metadata."""
+    """Marketplace listing wrapping a dataset with marketplace metadata.
+
+    Listings are updated in place by the registry (download counts, dataset
+    refreshes), so assignments are deliberately not re-validated.
+    """
+
+    model_config = ConfigDict(validate_assignment=False)
 
     dataset: AlignmentDataset
     downloads: int = Field(ge=0, default=0)
@@ -0,0 +1,40 @@
+"""Reusable scoring functions for aumai-alignment."""
+
+from __future__ import annotations
+
+__all__ = ["KeywordScorer"]
+
+
+class KeywordScorer:
+    """Score an output 1.0 if its text contains any keyword, else 0.0.
+
+    Keywords are lowercased and deduplicated once up front, and any keyword
+    that contains a shorter keyword is dropped since the shorter one always
+    matches first. Each output is lowercased once and checked with plain
+    substring tests, stopping at the first hit.
+    """
+
+    def __init__(self, keywords: list[str], field: str = "response") -> None:
+        """Build the matcher.
+
+        Args:
+            keywords: Keywords to look for; matching is case-insensitive.
+            field: Key of the output dict holding the text to scan.
+
+        Raises:
+            ValueError: If keywords is empty.
+        """
+        if not keywords:
+            raise ValueError("KeywordScorer requires at least one keyword")
+        self._field = field
+        unique = sorted(set(map(str.lower, keywords)), key=len)
+        kept: list[str] = []
+        for keyword in unique:
+            if not any(shorter in keyword for shorter in kept):
+                kept.append(keyword)
+        self._keywords = tuple(kept)
+
+    def __call__(self, output: dict[str, str | float | bool]) -> float:
+        """Score a single model output."""
+        text = str(output.get(self._field, "")).lower()
+        return 1.0 if any(keyword in text for keyword in self._keywords) else 0.0
@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+import contextlib
+import copy
+import io
 import json
-import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
 from aumai_alignment.core import DatasetRegistry, EvaluationRunner
-from aumai_alignment.models import AlignmentDataset, MarketplaceListing
+from aumai_alignment.models import AlignmentDataset
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_dataset() -> AlignmentDataset:
     """Minimal valid AlignmentDataset for testing."""
     return AlignmentDataset(
@@ -28,7 +31,7 @@ def sample_dataset() -> AlignmentDataset:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def high_quality_dataset() -> AlignmentDataset:
     """AlignmentDataset with maximum quality score."""
     return AlignmentDataset(
@@ -44,7 +47,7 @@ def high_quality_dataset() -> AlignmentDataset:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def low_quality_dataset() -> AlignmentDataset:
     """AlignmentDataset with low quality score."""
     return AlignmentDataset(
@@ -60,39 +63,78 @@ def low_quality_dataset() -> AlignmentDataset:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def registry(
     sample_dataset: AlignmentDataset,
     high_quality_dataset: AlignmentDataset,
 ) -> DatasetRegistry:
-    """Pre-populated DatasetRegistry with two datasets."""
+    """Pre-populated DatasetRegistry with two datasets.
+
+    Shared by the whole session, so tests must treat it as read-only; tests
+    that register or count downloads should request ``registry_mut``.
+    """
     reg = DatasetRegistry()
     reg.register(sample_dataset)
     reg.register(high_quality_dataset)
     return reg
 
 
+@pytest.fixture()
+def registry_mut(registry: DatasetRegistry) -> DatasetRegistry:
+    """Private, mutable copy of the pre-populated registry."""
+    return copy.deepcopy(registry)
+
+
 @pytest.fixture()
 def runner(registry: DatasetRegistry) -> EvaluationRunner:
     """EvaluationRunner backed by the pre-populated registry."""
     return EvaluationRunner(registry=registry)
 
 
-@pytest.fixture()
-def dataset_json_file(sample_dataset: AlignmentDataset, tmp_path: Path) -> Path:
-    """Write a valid dataset JSON file to tmp_path and return the path."""
+@pytest.fixture(scope="session")
+def dataset_json_file(
+    sample_dataset: AlignmentDataset, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Write a valid dataset JSON file once per session and return the path."""
     data = sample_dataset.model_dump(mode="json")
-    file_path = tmp_path / "dataset.json"
+    file_path = tmp_path_factory.mktemp("json-config") / "dataset.json"
     file_path.write_text(json.dumps(data), encoding="utf-8")
     return file_path
 
 
-@pytest.fixture()
-def dataset_yaml_file(sample_dataset: AlignmentDataset, tmp_path: Path) -> Path:
-    """Write a valid dataset YAML file to tmp_path and return the path."""
+@pytest.fixture(scope="session")
+def dataset_yaml_file(
+    sample_dataset: AlignmentDataset, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Write a valid dataset YAML file once per session and return the path."""
     import yaml  # type: ignore[import-untyped]
 
+    try:
+        from yaml import CSafeDumper as _Dumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper as _Dumper
+
     data = sample_dataset.model_dump(mode="json")
-    file_path = tmp_path / "dataset.yaml"
-    file_path.write_text(yaml.dump(data), encoding="utf-8")
+    file_path = tmp_path_factory.mktemp("yaml-config") / "dataset.yaml"
+    file_path.write_text(yaml.dump(data, Dumper=_Dumper), encoding="utf-8")
     return file_path
+
+
+@pytest.fixture()
+def invoke_cmd() -> Callable[..., str]:
+    """Call a CLI command's callback directly and return its stdout.
+
+    Skips Click's argv parsing and CliRunner's stdio isolation, so use it for
+    tests of command behaviour rather than option parsing.
+    """
+    from aumai_alignment.cli import main
+
+    def _invoke(name: str, **kwargs: object) -> str:
+        callback = main.commands[name].callback
+        assert callback is not None
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            callback(**kwargs)
+        return buffer.getvalue()
+
+    return _invoke
@@ -0,0 +1,65 @@
+"""Tests for the aumai-alignment HTTP API."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from aumai_alignment.api import app
+from aumai_alignment.models import AlignmentDataset
+
+
+@pytest.fixture(scope="module")
+def client(sample_dataset: AlignmentDataset) -> TestClient:
+    """TestClient for the app, with the sample dataset registered."""
+    test_client = TestClient(app)
+    response = test_client.post(
+        "/api/datasets", json=sample_dataset.model_dump(mode="json")
+    )
+    assert response.status_code == 201
+    return test_client
+
+
+class TestListDatasetsEndpoint:
+    def test_limit_caps_results(
+        self, client: TestClient, high_quality_dataset: AlignmentDataset
+    ) -> None:
+        client.post("/api/datasets", json=high_quality_dataset.model_dump(mode="json"))
+        response = client.get("/api/datasets", params={"limit": 1})
+        assert response.status_code == 200
+        body = response.json()
+        assert [r["dataset"]["dataset_id"] for r in body] == ["ds-002"]
+
+    def test_default_limit_is_50(
+        self, client: TestClient, sample_dataset: AlignmentDataset
+    ) -> None:
+        for index in range(55):
+            extra = sample_dataset.model_copy(
+                update={"dataset_id": f"bulk-{index}", "quality_score": 0.1}
+            )
+            client.post("/api/datasets", json=extra.model_dump(mode="json"))
+        response = client.get("/api/datasets")
+        assert response.status_code == 200
+        assert len(response.json()) == 50
+
+    def test_zero_limit_rejected(self, client: TestClient) -> None:
+        response = client.get("/api/datasets", params={"limit": 0})
+        assert response.status_code == 422
+
+
+class TestEvaluateBatchEndpoint:
+    def test_returns_one_result_per_model(self, client: TestClient) -> None:
+        response = client.post(
+            "/api/evaluations/ds-001/batch",
+            json={"alpha": [{"score": 0.8}, {"score": 0.6}], "beta": [{"score": 0.2}]},
+        )
+        assert response.status_code == 201
+        body = response.json()
+        assert [r["model_name"] for r in body] == ["alpha", "beta"]
+        assert body[1]["score"] == 0.2
+
+    def test_unknown_dataset_returns_404(self, client: TestClient) -> None:
+        response = client.post(
+            "/api/evaluations/nonexistent/batch", json={"alpha": [{"score": 0.5}]}
+        )
+        assert response.status_code == 404
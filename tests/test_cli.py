@@ -2,134 +2,189 @@
 
 from __future__ import annotations
 
-import json
-import tempfile
-from pathlib import Path
+from typing import TYPE_CHECKING
 
+import click
 import pytest
-from click.testing import CliRunner
+from pydantic import ValidationError
 
-from aumai_alignment.cli import main
-from aumai_alignment.models import AlignmentDataset
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
 
+    from click.testing import CliRunner
+
+    from aumai_alignment.models import AlignmentDataset
+
+# The CLI and click.testing are imported by the fixtures below rather than at
+# module level, so `pytest -k` runs that skip this module never load them.
+
+
+@pytest.fixture(scope="session")
+def main() -> click.Group:
+    """The ``aumai-alignment`` command group."""
+    from aumai_alignment.cli import main
+
+    return main
+
+
+@pytest.fixture(scope="module")
+def cli_runner() -> CliRunner:
+    """CliRunner shared by every test in this module."""
+    from click.testing import CliRunner
 
-def _fresh_runner() -> CliRunner:
-    """Return a CliRunner without mix_stderr (Click 8.2 compatible)."""
     return CliRunner()
 
 
-class TestCLIVersion:
-    def test_version_flag(self) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["--version"])
+class TestHelp:
+    @pytest.mark.parametrize(
+        ("argv", "needles"),
+        [
+            (["--help"], ["alignment"]),
+            (["search", "--help"], ["query"]),
+            (["register", "--help"], ["config"]),
+            (["serve", "--help"], ["port", "host"]),
+        ],
+    )
+    def test_help(
+        self,
+        main: click.Group,
+        cli_runner: CliRunner,
+        argv: list[str],
+        needles: list[str],
+    ) -> None:
+        result = cli_runner.invoke(main, argv)
         assert result.exit_code == 0
-        assert "0.1.0" in result.output
+        for needle in needles:
+            assert needle in result.output.lower()
+
 
-    def test_help_flag(self) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["--help"])
+class TestCLIVersion:
+    def test_version_flag(self, main: click.Group, cli_runner: CliRunner) -> None:
+        result = cli_runner.invoke(main, ["--version"])
         assert result.exit_code == 0
-        assert "alignment" in result.output.lower() or "AumAI" in result.output
+        assert "0.1.0" in result.output
 
 
 class TestSearchCommand:
-    def test_search_empty_registry_returns_no_datasets(self) -> None:
-        runner = _fresh_runner()
+    def test_search_empty_registry_returns_no_datasets(
+        self, invoke_cmd: Callable[..., str]
+    ) -> None:
         # Module-level registry is shared; search with an unlikely query
-        result = runner.invoke(main, ["search", "--query", "zzznonexistentzzz"])
-        assert result.exit_code == 0
-        assert "No datasets found" in result.output
-
-    def test_search_help(self) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["search", "--help"])
-        assert result.exit_code == 0
-        assert "query" in result.output.lower()
+        output = invoke_cmd(
+            "search", query="zzznonexistentzzz", category=None, min_quality=0.0
+        )
+        assert "No datasets found" in output
 
-    def test_search_with_min_quality_option(self) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["search", "--query", "", "--min-quality", "0.9"])
+    def test_search_with_min_quality_option(
+        self, main: click.Group, cli_runner: CliRunner
+    ) -> None:
+        result = cli_runner.invoke(
+            main, ["search", "--query", "", "--min-quality", "0.9"]
+        )
         assert result.exit_code == 0
 
-    def test_search_with_category_option(self) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["search", "--query", "", "--category", "safety"])
-        assert result.exit_code == 0
+    def test_search_with_category_option(
+        self,
+        invoke_cmd: Callable[..., str],
+        dataset_json_file: Path,
+        sample_dataset: AlignmentDataset,
+    ) -> None:
+        invoke_cmd("register", config=(dataset_json_file,))
+        output = invoke_cmd(
+            "search", query="", category=sample_dataset.category, min_quality=0.0
+        )
+        assert f"[{sample_dataset.dataset_id}]" in output
+        output = invoke_cmd(
+            "search", query="", category="zzznonexistentzzz", min_quality=0.0
+        )
+        assert "No datasets found" in output
 
 
 class TestRegisterCommand:
     def test_register_json_file(
-        self, dataset_json_file: Path, sample_dataset: AlignmentDataset
+        self,
+        invoke_cmd: Callable[..., str],
+        dataset_json_file: Path,
+        sample_dataset: AlignmentDataset,
     ) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["register", "--config", str(dataset_json_file)])
-        assert result.exit_code == 0
-        assert "Registered dataset" in result.output
-        assert sample_dataset.name in result.output
+        output = invoke_cmd("register", config=(dataset_json_file,))
+        assert "Registered dataset" in output
+        assert sample_dataset.name in output
 
     def test_register_yaml_file(
-        self, dataset_yaml_file: Path, sample_dataset: AlignmentDataset
+        self, invoke_cmd: Callable[..., str], dataset_yaml_file: Path
     ) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["register", "--config", str(dataset_yaml_file)])
-        assert result.exit_code == 0
-        assert "Registered dataset" in result.output
+        output = invoke_cmd("register", config=(dataset_yaml_file,))
+        assert "Registered dataset" in output
 
-    def test_register_missing_config_flag_errors(self) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["register"])
-        assert result.exit_code != 0
+    def test_register_missing_config_flag_errors(
+        self, main: click.Group, cli_runner: CliRunner
+    ) -> None:
+        result = cli_runner.invoke(main, ["register"], standalone_mode=False)
+        assert isinstance(result.exception, click.UsageError)
 
-    def test_register_nonexistent_file_errors(self, tmp_path: Path) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["register", "--config", str(tmp_path / "missing.json")])
-        assert result.exit_code != 0
+    def test_register_nonexistent_file_errors(
+        self, invoke_cmd: Callable[..., str], tmp_path: Path
+    ) -> None:
+        with pytest.raises(FileNotFoundError):
+            invoke_cmd("register", config=(tmp_path / "missing.json",))
 
     def test_register_outputs_dataset_id(
-        self, dataset_json_file: Path, sample_dataset: AlignmentDataset
+        self,
+        invoke_cmd: Callable[..., str],
+        dataset_json_file: Path,
+        sample_dataset: AlignmentDataset,
     ) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["register", "--config", str(dataset_json_file)])
-        assert sample_dataset.dataset_id in result.output
+        output = invoke_cmd("register", config=(dataset_json_file,))
+        assert sample_dataset.dataset_id in output
 
     def test_register_then_search_finds_dataset(
-        self, dataset_json_file: Path, sample_dataset: AlignmentDataset
+        self,
+        main: click.Group,
+        cli_runner: CliRunner,
+        dataset_json_file: Path,
+        sample_dataset: AlignmentDataset,
     ) -> None:
-        runner = _fresh_runner()
-        runner.invoke(main, ["register", "--config", str(dataset_json_file)])
-        search_result = runner.invoke(
+        cli_runner.invoke(main, ["register", "--config", str(dataset_json_file)])
+        search_result = cli_runner.invoke(
             main, ["search", "--query", sample_dataset.name[:8]]
         )
         assert search_result.exit_code == 0
 
-    def test_register_invalid_json_errors(self, tmp_path: Path) -> None:
+    def test_register_multiple_configs(
+        self,
+        invoke_cmd: Callable[..., str],
+        dataset_json_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        other_file = tmp_path / "other.json"
+        other_file.write_text(
+            dataset_json_file.read_text(encoding="utf-8").replace("ds-001", "ds-101"),
+            encoding="utf-8",
+        )
+        output = invoke_cmd("register", config=(dataset_json_file, other_file))
+        assert "'ds-001'" in output
+        assert "'ds-101'" in output
+
+    def test_register_invalid_json_errors(
+        self, invoke_cmd: Callable[..., str], tmp_path: Path
+    ) -> None:
         bad_file = tmp_path / "bad.json"
         bad_file.write_text("not json at all {{{{", encoding="utf-8")
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["register", "--config", str(bad_file)])
-        assert result.exit_code != 0
-
-    def test_register_help(self) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["register", "--help"])
-        assert result.exit_code == 0
-        assert "config" in result.output.lower()
+        with pytest.raises(ValidationError):
+            invoke_cmd("register", config=(bad_file,))
 
 
 class TestServeCommand:
-    def test_serve_without_uvicorn_exits_nonzero(self) -> None:
+    def test_serve_without_uvicorn_exits_nonzero(self, cli_runner: CliRunner) -> None:
         """Serve should exit 1 if uvicorn is not installed or fails."""
         import unittest.mock as mock
 
-        runner = _fresh_runner()
         with mock.patch.dict("sys.modules", {"uvicorn": None}):
-            result = runner.invoke(main, ["serve"])
-        # Either exits with error code (uvicorn missing) or succeeds if installed
-        assert isinstance(result.exit_code, int)
+            from aumai_alignment.cli import main
 
-    def test_serve_help(self) -> None:
-        runner = _fresh_runner()
-        result = runner.invoke(main, ["serve", "--help"])
-        assert result.exit_code == 0
-        assert "port" in result.output.lower()
-        assert "host" in result.output.lower()
+            result = cli_runner.invoke(main, ["serve"], standalone_mode=False)
+        # Patching uvicorn out of sys.modules makes its import fail
+        assert isinstance(result.exception, SystemExit)
+        assert result.exit_code == 1
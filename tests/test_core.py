@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Annotated
+
 import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from aumai_alignment.core import (
     DatasetNotFoundError,
     DatasetRegistry,
     EvaluationRunner,
     _default_scorer,
+    _default_scores,
 )
 from aumai_alignment.models import AlignmentDataset, EvaluationResult, MarketplaceListing
 
 
+def _field_adapter(model: type[BaseModel], name: str) -> TypeAdapter[object]:
+    """Build a validator for one model field, constraints included."""
+    field = model.model_fields[name]
+    return TypeAdapter(Annotated[field.annotation, *field.metadata])
+
+
+# Compiled once at import so the bounds tests validate a single field
+# instead of constructing whole models.
+_QUALITY_SCORE = _field_adapter(AlignmentDataset, "quality_score")
+_SIZE = _field_adapter(AlignmentDataset, "size")
+_RATING = _field_adapter(MarketplaceListing, "rating")
+_DOWNLOADS = _field_adapter(MarketplaceListing, "downloads")
+
+
+def _one(_: dict[str, str | float | bool]) -> float:
+    """Scoring function that gives every output full marks."""
+    return 1.0
+
+
 # ---------------------------------------------------------------------------
 # AlignmentDataset model tests
 # ---------------------------------------------------------------------------
@@ -24,44 +48,19 @@ class TestAlignmentDatasetModel:
         assert sample_dataset.name == "Safety Prompts v1"
         assert sample_dataset.quality_score == 0.85
 
-    def test_dataset_quality_score_bounds(self) -> None:
-        with pytest.raises(Exception):
-            AlignmentDataset(
-                dataset_id="x",
-                name="x",
-                description="x",
-                category="x",
-                size=0,
-                format="json",
-                license="MIT",
-                quality_score=1.1,  # exceeds upper bound
-            )
-
-    def test_dataset_quality_score_lower_bound(self) -> None:
-        with pytest.raises(Exception):
-            AlignmentDataset(
-                dataset_id="x",
-                name="x",
-                description="x",
-                category="x",
-                size=0,
-                format="json",
-                license="MIT",
-                quality_score=-0.1,  # below lower bound
-            )
-
-    def test_dataset_size_non_negative(self) -> None:
-        with pytest.raises(Exception):
-            AlignmentDataset(
-                dataset_id="x",
-                name="x",
-                description="x",
-                category="x",
-                size=-1,  # negative size
-                format="json",
-                license="MIT",
-                quality_score=0.5,
-            )
+    @pytest.mark.parametrize(
+        ("adapter", "bad_value"),
+        [
+            pytest.param(_QUALITY_SCORE, 1.1, id="quality_score-upper"),
+            pytest.param(_QUALITY_SCORE, -0.1, id="quality_score-lower"),
+            pytest.param(_SIZE, -1, id="size-negative"),
+        ],
+    )
+    def test_dataset_field_bounds(
+        self, adapter: TypeAdapter[object], bad_value: float
+    ) -> None:
+        with pytest.raises(ValidationError):
+            adapter.validate_python(bad_value)
 
     def test_dataset_tags_default_empty(self) -> None:
         ds = AlignmentDataset(
@@ -106,17 +105,19 @@ class TestMarketplaceListingModel:
         assert listing.rating == 0.0
         assert listing.reviews == 0
 
-    def test_rating_upper_bound(self, sample_dataset: AlignmentDataset) -> None:
-        with pytest.raises(Exception):
-            MarketplaceListing(dataset=sample_dataset, rating=5.1)
-
-    def test_rating_lower_bound(self, sample_dataset: AlignmentDataset) -> None:
-        with pytest.raises(Exception):
-            MarketplaceListing(dataset=sample_dataset, rating=-0.1)
-
-    def test_downloads_non_negative(self, sample_dataset: AlignmentDataset) -> None:
-        with pytest.raises(Exception):
-            MarketplaceListing(dataset=sample_dataset, downloads=-1)
+    @pytest.mark.parametrize(
+        ("adapter", "bad_value"),
+        [
+            pytest.param(_RATING, 5.1, id="rating-upper"),
+            pytest.param(_RATING, -0.1, id="rating-lower"),
+            pytest.param(_DOWNLOADS, -1, id="downloads-negative"),
+        ],
+    )
+    def test_listing_field_bounds(
+        self, adapter: TypeAdapter[object], bad_value: float
+    ) -> None:
+        with pytest.raises(ValidationError):
+            adapter.validate_python(bad_value)
 
 
 # ---------------------------------------------------------------------------
@@ -144,27 +145,65 @@ class TestDatasetRegistry:
             registry.get("nonexistent-id")
 
     def test_register_overwrites_dataset_preserves_downloads(
-        self, registry: DatasetRegistry, sample_dataset: AlignmentDataset
+        self, registry_mut: DatasetRegistry, sample_dataset: AlignmentDataset
     ) -> None:
-        registry.increment_downloads("ds-001")
+        registry_mut.increment_downloads("ds-001")
         # Re-register the same dataset — downloads should be preserved
-        registry.register(sample_dataset)
-        listing = registry._listings["ds-001"]
+        registry_mut.register(sample_dataset)
+        listing = registry_mut._listings["ds-001"]
         assert listing.downloads == 1
 
+    def test_register_overwrite_updates_listing_in_place(
+        self, registry_mut: DatasetRegistry, sample_dataset: AlignmentDataset
+    ) -> None:
+        listing = registry_mut._listings["ds-001"]
+        updated = sample_dataset.model_copy(update={"quality_score": 0.5})
+        registry_mut.register(updated)
+        assert registry_mut._listings["ds-001"] is listing
+        assert listing.dataset is updated
+
+    @pytest.mark.parametrize("ids", [["a", "b", "c"], ["a", "b"]])
+    def test_reregister_after_in_place_quality_change(
+        self, sample_dataset: AlignmentDataset, ids: list[str]
+    ) -> None:
+        reg = DatasetRegistry()
+        datasets = {
+            dataset_id: sample_dataset.model_copy(
+                update={"dataset_id": dataset_id, "quality_score": quality}
+            )
+            for dataset_id, quality in zip(ids, [0.9, 0.5, 0.3], strict=False)
+        }
+        for dataset in datasets.values():
+            reg.register(dataset)
+        datasets["a"].quality_score = 0.4
+        reg.register(datasets["a"])
+        expected = ["b", "a", "c"][: len(ids)]
+        assert [r.dataset.dataset_id for r in reg.search("")] == expected
+
+    def test_reregister_after_in_place_category_change(
+        self, sample_dataset: AlignmentDataset
+    ) -> None:
+        reg = DatasetRegistry()
+        dataset = sample_dataset.model_copy(update={"category": "safety"})
+        reg.register(dataset)
+        dataset.category = "honesty"
+        reg.register(dataset)
+        assert reg.search("", category="safety") == []
+        assert [r.dataset for r in reg.search("", category="honesty")] == [dataset]
+
     def test_register_new_listing_starts_zero_downloads(self, sample_dataset: AlignmentDataset) -> None:
         reg = DatasetRegistry()
         reg.register(sample_dataset)
         assert reg._listings["ds-001"].downloads == 0
 
-    def test_increment_downloads_increases_count(self, registry: DatasetRegistry) -> None:
-        registry.increment_downloads("ds-001")
-        registry.increment_downloads("ds-001")
-        assert registry._listings["ds-001"].downloads == 2
+    def test_increment_downloads_increases_count(self, registry_mut: DatasetRegistry) -> None:
+        registry_mut.increment_downloads("ds-001")
+        registry_mut.increment_downloads("ds-001")
+        assert registry_mut._listings["ds-001"].downloads == 2
 
-    def test_increment_downloads_no_op_for_missing(self, registry: DatasetRegistry) -> None:
+    def test_increment_downloads_no_op_for_missing(self, registry_mut: DatasetRegistry) -> None:
         # Should not raise; just silently skip
-        registry.increment_downloads("missing-id")
+        registry_mut.increment_downloads("missing-id")
 
     def test_search_empty_query_returns_all(self, registry: DatasetRegistry) -> None:
         results = registry.search(query="")
@@ -202,17 +241,24 @@ class TestDatasetRegistry:
         results = registry.search(query="", category="HELPFULNESS")
         assert len(results) == 1
 
+    def test_search_category_normalized_at_registration(
+        self, registry_mut: DatasetRegistry, low_quality_dataset: AlignmentDataset
+    ) -> None:
+        registry_mut.register(low_quality_dataset.model_copy(update={"category": "SaFeTy"}))
+        results = registry_mut.search(query="", category="safety")
+        assert [r.dataset.dataset_id for r in results] == ["ds-001", "ds-003"]
+
     def test_search_category_no_match(self, registry: DatasetRegistry) -> None:
         results = registry.search(query="", category="unknown-category")
         assert results == []
 
     def test_search_min_quality_filters_low(
         self,
-        registry: DatasetRegistry,
+        registry_mut: DatasetRegistry,
         low_quality_dataset: AlignmentDataset,
     ) -> None:
-        registry.register(low_quality_dataset)
-        results = registry.search(query="", min_quality=0.50)
+        registry_mut.register(low_quality_dataset)
+        results = registry_mut.search(query="", min_quality=0.50)
         ids = {r.dataset.dataset_id for r in results}
         assert "ds-003" not in ids
 
@@ -221,6 +267,61 @@ class TestDatasetRegistry:
         scores = [r.dataset.quality_score for r in results]
         assert scores == sorted(scores, reverse=True)
 
+    def test_search_limit_returns_top_results(
+        self,
+        registry_mut: DatasetRegistry,
+        low_quality_dataset: AlignmentDataset,
+    ) -> None:
+        registry_mut.register(low_quality_dataset)
+        results = registry_mut.search(query="", limit=2)
+        assert [r.dataset.dataset_id for r in results] == ["ds-002", "ds-001"]
+
+    def test_search_order_follows_reregistered_quality(
+        self, registry_mut: DatasetRegistry, sample_dataset: AlignmentDataset
+    ) -> None:
+        registry_mut.register(sample_dataset.model_copy(update={"quality_score": 0.99}))
+        results = registry_mut.search(query="")
+        assert [r.dataset.dataset_id for r in results] == ["ds-001", "ds-002"]
+        results = registry_mut.search(query="", min_quality=0.97)
+        assert [r.dataset.dataset_id for r in results] == ["ds-001"]
+
+    def test_search_cache_invalidated_by_register(
+        self, registry_mut: DatasetRegistry, low_quality_dataset: AlignmentDataset
+    ) -> None:
+        assert len(registry_mut.search(query="", category="safety")) == 1
+        registry_mut.register(low_quality_dataset)
+        assert len(registry_mut.search(query="", category="safety")) == 2
+
+    def test_search_not_cached_across_concurrent_register(
+        self,
+        sample_dataset: AlignmentDataset,
+        low_quality_dataset: AlignmentDataset,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        reg = DatasetRegistry()
+        reg.register(sample_dataset)
+        search = reg._search
+
+        def register_mid_search(*key: object) -> list[MarketplaceListing]:
+            results = search(*key)  # type: ignore[arg-type]
+            monkeypatch.undo()
+            reg.register(low_quality_dataset)
+            return results
+
+        monkeypatch.setattr(reg, "_search", register_mid_search)
+        assert len(reg.search(query="", category="safety")) == 1
+        assert len(reg.search(query="", category="safety")) == 2
+
+    def test_search_cached_results_are_independent_lists(
+        self, registry_mut: DatasetRegistry
+    ) -> None:
+        first = registry_mut.search(query="")
+        first.clear()
+        registry_mut.increment_downloads("ds-001")
+        results = registry_mut.search(query="")
+        assert len(results) == 2
+        assert results[1].downloads == 1
+
     def test_search_combined_query_and_category(self, registry: DatasetRegistry) -> None:
         results = registry.search(query="safety", category="safety")
         assert len(results) == 1
@@ -229,6 +330,24 @@ class TestDatasetRegistry:
         results = registry.search(query="helpfulness", category="safety")
         assert results == []
 
+    def test_search_matches_partial_words(self, registry: DatasetRegistry) -> None:
+        results = registry.search(query="armless")
+        assert [r.dataset.dataset_id for r in results] == ["ds-001"]
+        results = registry.search(query="ty prom")
+        assert [r.dataset.dataset_id for r in results] == ["ds-001"]
+
+    def test_search_reindexes_on_reregister(
+        self, registry_mut: DatasetRegistry, sample_dataset: AlignmentDataset
+    ) -> None:
+        updated = sample_dataset.model_copy(
+            update={"name": "Renamed", "tags": [], "category": "honesty"}
+        )
+        registry_mut.register(updated)
+        assert registry_mut.search(query="harmlessness") == []
+        assert registry_mut.search(query="", category="safety") == []
+        results = registry_mut.search(query="renamed", category="honesty")
+        assert [r.dataset.dataset_id for r in results] == ["ds-001"]
+
 
 # ---------------------------------------------------------------------------
 # EvaluationRunner tests
@@ -270,8 +389,9 @@ class TestEvaluationRunner:
     def test_evaluate_metrics_min_max(self, runner: EvaluationRunner) -> None:
         outputs = [{"score": 0.9}, {"score": 0.3}, {"score": 0.6}]
         result = runner.evaluate("ds-001", outputs)
-        assert result.metrics["min_score"] == pytest.approx(0.3)
-        assert result.metrics["max_score"] == pytest.approx(0.9)
+        # Scores inside [0, 1] pass through unchanged, so min and max are exact.
+        assert result.metrics["min_score"] == 0.3
+        assert result.metrics["max_score"] == 0.9
 
     def test_evaluate_score_clamped_to_unit_interval(self, runner: EvaluationRunner) -> None:
         # Default scorer clamps to [0, 1]
@@ -294,11 +414,83 @@ class TestEvaluationRunner:
         assert runner.get_results("never-evaluated") == []
 
     def test_evaluate_uses_custom_scorer(self, registry: DatasetRegistry) -> None:
-        custom_scorer = lambda output: 1.0  # always returns 1.0  # noqa: E731
-        custom_runner = EvaluationRunner(registry=registry, scoring_fn=custom_scorer)
+        custom_runner = EvaluationRunner(registry=registry, scoring_fn=_one)
         result = custom_runner.evaluate("ds-001", [{"text": "hello"}, {"text": "world"}])
         assert result.score == 1.0
 
+    def test_constant_scorer_called_once(self, registry: DatasetRegistry) -> None:
+        calls: list[dict[str, str | float | bool]] = []
+
+        def constant(output: dict[str, str | float | bool]) -> float:
+            calls.append(output)
+            return 0.25
+
+        constant.is_constant = True  # type: ignore[attr-defined]
+        constant_runner = EvaluationRunner(registry=registry, scoring_fn=constant)
+        result = constant_runner.evaluate("ds-001", [{"text": "a"}] * 5)
+        assert len(calls) == 1
+        assert result.score == 0.25
+        assert result.metrics["min_score"] == result.metrics["max_score"] == 0.25
+
+    def test_constant_scorer_with_no_outputs(self, registry: DatasetRegistry) -> None:
+        def constant(output: dict[str, str | float | bool]) -> float:
+            raise AssertionError("should not be called")
+
+        constant.is_constant = True  # type: ignore[attr-defined]
+        constant_runner = EvaluationRunner(registry=registry, scoring_fn=constant)
+        assert constant_runner.evaluate("ds-001", []).score == 0.0
+
+    def test_evaluate_batch_returns_result_per_model(self, runner: EvaluationRunner) -> None:
+        results = runner.evaluate_batch(
+            "ds-001",
+            {"alpha": [{"score": 0.8}, {"score": 0.6}], "beta": [{"score": 0.2}]},
+        )
+        assert [r.model_name for r in results] == ["alpha", "beta"]
+        assert results[0].score == pytest.approx(0.7, abs=1e-4)
+        assert results[1].score == 0.2
+        assert results[0].evaluated_at == results[1].evaluated_at
+
+    def test_evaluate_batch_stores_results(self, runner: EvaluationRunner) -> None:
+        runner.evaluate_batch("ds-001", {"alpha": [{"score": 0.5}], "beta": []})
+        assert [r.model_name for r in runner.get_results("ds-001")] == ["alpha", "beta"]
+
+    def test_evaluate_batch_raises_for_missing_dataset(self, runner: EvaluationRunner) -> None:
+        with pytest.raises(DatasetNotFoundError):
+            runner.evaluate_batch("nonexistent", {"alpha": [{"score": 0.5}]})
+
+    def test_results_dir_appends_one_line_per_result(
+        self, registry: DatasetRegistry, tmp_path: Path
+    ) -> None:
+        persistent = EvaluationRunner(registry=registry, results_dir=tmp_path)
+        persistent.evaluate("ds-001", [{"score": 0.5}])
+        persistent.evaluate_batch("ds-001", {"a": [{"score": 0.1}], "b": []})
+        lines = (tmp_path / "ds-001.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+
+    def test_results_dir_history_survives_new_runner(
+        self, registry: DatasetRegistry, tmp_path: Path
+    ) -> None:
+        first = EvaluationRunner(registry=registry, results_dir=tmp_path)
+        original = first.evaluate("ds-001", [{"score": 0.8}], model_name="m1")
+        second = EvaluationRunner(registry=registry, results_dir=tmp_path)
+        assert second.get_results("ds-001") == [original]
+        second.evaluate("ds-001", [{"score": 0.2}], model_name="m2")
+        assert [r.model_name for r in second.get_results("ds-001")] == ["m1", "m2"]
+        assert second.get_results("ds-002") == []
+
+    @pytest.mark.parametrize("dataset_id", ["org/safety-v1", "../escape"])
+    def test_results_dir_keeps_unsafe_ids_inside_dir(
+        self, sample_dataset: AlignmentDataset, tmp_path: Path, dataset_id: str
+    ) -> None:
+        reg = DatasetRegistry()
+        reg.register(sample_dataset.model_copy(update={"dataset_id": dataset_id}))
+        results_dir = tmp_path / "results"
+        first = EvaluationRunner(registry=reg, results_dir=results_dir)
+        original = first.evaluate(dataset_id, [{"score": 0.5}])
+        assert [p.parent for p in tmp_path.rglob("*.jsonl")] == [results_dir]
+        second = EvaluationRunner(registry=reg, results_dir=results_dir)
+        assert second.get_results(dataset_id) == [original]
+
     def test_evaluate_model_name_defaults_to_unknown(self, runner: EvaluationRunner) -> None:
         result = runner.evaluate("ds-001", [{"score": 0.5}])
         assert result.model_name == "unknown"
@@ -316,27 +508,26 @@ class TestEvaluationRunner:
 
 
 class TestDefaultScorer:
-    def test_returns_score_value(self) -> None:
-        assert _default_scorer({"score": 0.75}) == pytest.approx(0.75)
-
-    def test_clamps_above_one(self) -> None:
-        assert _default_scorer({"score": 5.0}) == 1.0
-
-    def test_clamps_below_zero(self) -> None:
-        assert _default_scorer({"score": -3.0}) == 0.0
-
-    def test_defaults_to_half_when_no_score_key(self) -> None:
-        assert _default_scorer({"text": "hello"}) == 0.5
-
-    def test_non_numeric_score_returns_half(self) -> None:
-        assert _default_scorer({"score": "high"}) == 0.5
-
-    def test_integer_score_treated_as_float(self) -> None:
-        assert _default_scorer({"score": 1}) == 1.0
-
-    def test_boolean_true_treated_as_one(self) -> None:
-        # bool is subclass of int in Python
-        assert _default_scorer({"score": True}) == 1.0
+    @pytest.mark.parametrize(
+        ("output", "expected"),
+        [
+            ({"score": 0.75}, 0.75),
+            ({"score": 5.0}, 1.0),  # clamped above one
+            ({"score": -3.0}, 0.0),  # clamped below zero
+            ({"text": "hello"}, 0.5),  # no score key
+            ({"score": "high"}, 0.5),  # non-numeric score
+            ({"score": 1}, 1.0),  # integer treated as float
+            ({"score": True}, 1.0),  # bool is a subclass of int
+            ({"score": 0.0}, 0.0),
+        ],
+    )
+    def test_default_scorer(
+        self, output: dict[str, str | float | bool], expected: float
+    ) -> None:
+        assert _default_scorer(output) == expected
 
-    def test_zero_score(self) -> None:
-        assert _default_scorer({"score": 0.0}) == 0.0
+    def test_batch_matches_single_output_scorer(self) -> None:
+        float_outputs = [{"score": value} for value in (0.25, 5.0, -3.0, float("nan"))]
+        mixed_outputs = [{"score": 1}, {"score": True}, {"score": "high"}, {"text": "x"}]
+        for outputs in (float_outputs, mixed_outputs):
+            assert _default_scores(outputs) == [_default_scorer(o) for o in outputs]
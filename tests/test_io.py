@@ -0,0 +1,33 @@
+"""Tests for aumai-alignment file I/O helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from aumai_alignment.io import read_many
+
+
+class TestReadMany:
+    def test_empty_list_returns_empty(self) -> None:
+        assert read_many([]) == []
+
+    def test_single_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "one.txt"
+        path.write_bytes(b"one")
+        assert read_many([path]) == [b"one"]
+
+    def test_preserves_input_order(self, tmp_path: Path) -> None:
+        paths = []
+        for index in range(20):
+            path = tmp_path / f"file-{index}.txt"
+            path.write_bytes(str(index).encode())
+            paths.append(path)
+        assert read_many(paths) == [str(index).encode() for index in range(20)]
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        existing = tmp_path / "exists.txt"
+        existing.write_bytes(b"x")
+        with pytest.raises(FileNotFoundError):
+            read_many([existing, tmp_path / "missing.txt"])